@@ -22,8 +22,13 @@ print("Listening for DIS on UDP socket {}".format(UDP_PORT))
 
 gps = GPS();
 
+# Reusable receive buffer: each datagram is read into it in place instead
+# of allocating a fresh bytes object per packet.
+rxBuffer = bytearray(8192)
+
 def recv():
-    data = udpSocket.recv(1024) # buffer size in bytes
+    byteCount = udpSocket.recv_into(rxBuffer)
+    data = memoryview(rxBuffer)[:byteCount]
     pdu = createPdu(data);
     pduTypeName = pdu.__class__.__name__
 
@@ -6,9 +6,7 @@ __date__ = "$Jun 23, 2015 10:27:29 AM$"
 import socket
 import time
 
-from io import BytesIO
-
-from opendis.DataOutputStream import DataOutputStream
+from opendis.PduFactory import serializePdu
 from opendis.dis7 import EntityStatePdu
 from opendis.RangeCoordinates import *
 
@@ -44,10 +42,7 @@ def send():
     pdu.entityOrientation.phi = montereyLocation[5]
 
 
-    memoryStream = BytesIO()
-    outputStream = DataOutputStream(memoryStream)
-    pdu.serialize(outputStream)
-    data = memoryStream.getvalue()
+    data = serializePdu(pdu)
 
     while True:
         udpSocket.sendto(data, (DESTINATION_ADDRESS, UDP_PORT))
@@ -4,7 +4,7 @@ From https://github.com/arngarden/python_java_datastream
 This uses big endian (network) format.
 """
 
-from io import BufferedIOBase
+from io import BufferedIOBase, BytesIO
 import struct
 
 from .types import (
@@ -21,43 +21,72 @@ from .types import (
 )
 
 
+# Record type (32 bits) + record length (16 bits), the header shared by
+# the variable record formats in section 6.2.
+_RECORD_HEADER = struct.Struct('>IH')
+
+# Precompiled per-type formats, so each read costs one unpack call rather
+# than re-parsing a format string.
+_BOOL = struct.Struct('?')
+_INT8 = struct.Struct('b')
+_UINT8 = struct.Struct('B')
+_INT16 = struct.Struct('>h')
+_UINT16 = struct.Struct('>H')
+_INT32 = struct.Struct('>i')
+_UINT32 = struct.Struct('>I')
+_INT64 = struct.Struct('>q')
+_FLOAT32 = struct.Struct('>f')
+_FLOAT64 = struct.Struct('>d')
+
+
 class DataInputStream:
-    def __init__(self, stream: BufferedIOBase):
+    def __init__(self, stream: "BufferedIOBase | bytes | bytearray | memoryview"):
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            # BytesIO over an immutable bytes object shares its buffer
+            # rather than copying it, so this costs one small wrapper.
+            stream = BytesIO(stream)
         self.stream = stream
 
+    def read_record_header(self) -> "tuple[uint32, uint16]":
+        """Read a (record type, record length) variable record header."""
+        return _RECORD_HEADER.unpack(self.stream.read(6))
+
     def read_boolean(self) -> bool:
-        return struct.unpack('?', self.stream.read(1))[0]
+        return _BOOL.unpack(self.stream.read(1))[0]
 
     def read_byte(self) -> int8:
-        return struct.unpack('b', self.stream.read(1))[0]
+        return _INT8.unpack(self.stream.read(1))[0]
 
     def read_unsigned_byte(self) -> uint8:
-        return struct.unpack('B', self.stream.read(1))[0]
+        return _UINT8.unpack(self.stream.read(1))[0]
 
     def read_char(self) -> char16:
-        return chr(struct.unpack('>H', self.stream.read(2))[0])
+        return chr(_UINT16.unpack(self.stream.read(2))[0])
 
     def read_double(self) -> float64:
-        return struct.unpack('>d', self.stream.read(8))[0]
+        return _FLOAT64.unpack(self.stream.read(8))[0]
 
     def read_float(self) -> float32:
-        return struct.unpack('>f', self.stream.read(4))[0]
+        return _FLOAT32.unpack(self.stream.read(4))[0]
 
     def read_short(self) -> int16:
-        return struct.unpack('>h', self.stream.read(2))[0]
+        return _INT16.unpack(self.stream.read(2))[0]
 
     def read_unsigned_short(self) -> uint16:
-        return struct.unpack('>H', self.stream.read(2))[0]
+        return _UINT16.unpack(self.stream.read(2))[0]
 
     def read_long(self) -> int64:
-        return struct.unpack('>q', self.stream.read(8))[0]
+        return _INT64.unpack(self.stream.read(8))[0]
+
+    def read_bytes(self, length: int) -> bytes:
+        return self.stream.read(length)
 
     def read_utf(self) -> bytes:
-        utf_length = struct.unpack('>H', self.stream.read(2))[0]
+        utf_length = _UINT16.unpack(self.stream.read(2))[0]
         return self.stream.read(utf_length)
 
     def read_int(self) -> int32:
-        return struct.unpack('>i', self.stream.read(4))[0]
+        return _INT32.unpack(self.stream.read(4))[0]
 
     def read_unsigned_int(self) -> uint32:
-        return struct.unpack('>I', self.stream.read(4))[0]
+        return _UINT32.unpack(self.stream.read(4))[0]
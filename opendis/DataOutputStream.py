@@ -8,44 +8,68 @@ from io import BufferedIOBase
 import struct
 
 
+# Record type (32 bits) + record length (16 bits), the header shared by
+# the variable record formats in section 6.2.
+_RECORD_HEADER = struct.Struct('>IH')
+
+# Precompiled per-type formats, so each write costs one pack call rather
+# than re-parsing a format string.
+_BOOL = struct.Struct('?')
+_INT8 = struct.Struct('b')
+_UINT8 = struct.Struct('B')
+_INT16 = struct.Struct('>h')
+_UINT16 = struct.Struct('>H')
+_INT32 = struct.Struct('>i')
+_UINT32 = struct.Struct('>I')
+_INT64 = struct.Struct('>q')
+_FLOAT32 = struct.Struct('>f')
+_FLOAT64 = struct.Struct('>d')
+
+
 class DataOutputStream:
     def __init__(self, stream: BufferedIOBase):
         self.stream = stream
 
+    def write_record_header(self, recordType: int, recordLength: int) -> None:
+        """Write a (record type, record length) variable record header."""
+        self.stream.write(_RECORD_HEADER.pack(recordType, recordLength))
+
     def write_boolean(self, boolean: bool) -> None:
-        self.stream.write(struct.pack('?', boolean))
+        self.stream.write(_BOOL.pack(boolean))
 
     def write_byte(self, val: bytes) -> None:
-        self.stream.write(struct.pack('b', val))
+        self.stream.write(_INT8.pack(val))
 
     def write_unsigned_byte(self, val: bytes) -> None:
-        self.stream.write(struct.pack('B', val))
-    
+        self.stream.write(_UINT8.pack(val))
+
     def write_char(self, val: str) -> None:
-        self.stream.write(struct.pack('>H', ord(val)))
+        self.stream.write(_UINT16.pack(ord(val)))
 
     def write_double(self, val: float) -> None:
-        self.stream.write(struct.pack('>d', val))
+        self.stream.write(_FLOAT64.pack(val))
 
     def write_float(self, val: float) -> None:
-        self.stream.write(struct.pack('>f', val))
+        self.stream.write(_FLOAT32.pack(val))
 
     def write_short(self, val: int) -> None:
-        self.stream.write(struct.pack('>h', val))
+        self.stream.write(_INT16.pack(val))
 
     def write_unsigned_short(self, val: int) -> None:
-        self.stream.write(struct.pack('>H', val))
+        self.stream.write(_UINT16.pack(val))
 
     def write_long(self, val: int) -> None:
-        self.stream.write(struct.pack('>q', val))
+        self.stream.write(_INT64.pack(val))
+
+    def write_bytes(self, val: bytes) -> None:
+        self.stream.write(val)
 
     def write_utf(self, string: bytes) -> None:
-        self.stream.write(struct.pack('>H', len(string)))
+        self.stream.write(_UINT16.pack(len(string)))
         self.stream.write(string)
 
     def write_int(self, val: int) -> None:
-        self.stream.write(struct.pack('>i', val))
+        self.stream.write(_INT32.pack(val))
 
     def write_unsigned_int(self, val: int) -> None:
-        self.stream.write(struct.pack('>I', val))
-
+        self.stream.write(_UINT32.pack(val))
@@ -2,13 +2,16 @@ __author__ = "mcgredo"
 __date__ = "$Jun 25, 2015 11:31:42 AM$"
 
 from .DataInputStream import DataInputStream
+from .DataOutputStream import DataOutputStream
 from .dis7 import *
 from io import BytesIO
 from os import PathLike
+from types import MappingProxyType
 import binascii
 import io
 
-PduTypeDecoders = {
+# Read-only: the decoder table is fixed at import time.
+PduTypeDecoders = MappingProxyType({
        1 : EntityStatePdu
     ,  2 : FirePdu
     ,  3 : DetonationPdu
@@ -60,7 +63,7 @@ PduTypeDecoders = {
     , 66 : CollisionElasticPdu
     , 67 : EntityStateUpdatePdu
     , 69 : EntityDamageStatusPdu
- }
+ })
 
 
 def getPdu(inputStream: DataInputStream) -> PduSuperclass | None:
@@ -68,16 +71,15 @@ def getPdu(inputStream: DataInputStream) -> PduSuperclass | None:
     pduType = inputStream.read_byte()
     inputStream.stream.seek(0, 0) # Rewind to start
 
-    if pduType in PduTypeDecoders.keys():
-        Decoder = PduTypeDecoders[pduType]
-        pdu = Decoder()
-        pdu.parse(inputStream)
-        return pdu
+    Decoder = PduTypeDecoders.get(pduType)
+    if Decoder is None:
+        # Punt and return none if we don't have a match on anything
+        # print("Unable to find a PDU corresponding to PduType {}".format(pduType))
+        return None
 
-    # Punt and return none if we don't have a match on anything
-    # print("Unable to find a PDU corresponding to PduType {}".format(pduType))
-
-    return None
+    pdu = Decoder()
+    pdu.parse(inputStream)
+    return pdu
 
 
 def createPdu(data: bytes) -> PduSuperclass | None:
@@ -85,10 +87,15 @@ def createPdu(data: bytes) -> PduSuperclass | None:
         input: a bytebuffer of DIS data
         output: a python DIS pdu instance of the correct class"""
 
-    memoryStream = BytesIO(data)
-    inputStream = DataInputStream(memoryStream)
+    return getPdu(DataInputStream(data))
+
 
-    return getPdu(inputStream)
+def serializePdu(pdu: PduSuperclass) -> bytes:
+    """ Serialize a PDU into a single bytes buffer, ready to be sent in
+        one call (e.g. socket.sendto)."""
+    memoryStream = BytesIO()
+    pdu.serialize(DataOutputStream(memoryStream))
+    return memoryStream.getvalue()
 
 
 def createPduFromFilePath(filePath: PathLike) -> PduSuperclass | None:
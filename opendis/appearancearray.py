@@ -0,0 +1,105 @@
+"""appearancearray.py
+
+Column-oriented storage for appearance records. Simulations tracking many
+entities pay ~200 bytes and a Python object per AppearanceRecord; this
+module stores one packed 32-bit word per entity in a numpy array instead,
+with whole-column field access. Like RangeCoordinates, this module uses
+numpy; the wire modules do not.
+"""
+
+import numpy
+
+
+def decodeBuffer(recordClass: type, data: bytes) -> "dict[str, numpy.ndarray]":
+    """Decode consecutive 4-byte wire records into per-field columns.
+
+    One-shot path for log replay and bulk analysis: the whole buffer is
+    reinterpreted as a word column and every field extracted with one
+    vectorized shift-and-mask.
+    """
+    return AppearanceArray.fromBytes(recordClass, data).decodeFields()
+
+
+class AppearanceArray:
+    """Packed appearance words for many entities of one record class.
+
+    Field reads and writes operate on every entity at once as numpy
+    arrays; the wire representation is the same big-endian uint32 per
+    record as the scalar classes.
+    """
+    __slots__ = ('recordClass', 'words', '_layout')
+
+    def __init__(self, recordClass: type, count: int = 0):
+        self.recordClass = recordClass
+        self.words = numpy.zeros(count, dtype=numpy.uint32)
+        self._layout = {name: (shift, mask)
+                        for name, shift, mask in recordClass._LAYOUT}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def fromBytes(cls, recordClass: type, data: bytes) -> "AppearanceArray":
+        """Build an array from consecutive 4-byte wire records."""
+        array = cls(recordClass)
+        array.words = numpy.frombuffer(data, dtype='>u4').astype(numpy.uint32)
+        return array
+
+    def toBytes(self) -> bytes:
+        """Return the wire form of all records as one bytes buffer."""
+        return self.words.astype('>u4').tobytes()
+
+    @classmethod
+    def fromRecords(cls, recordClass: type, records) -> "AppearanceArray":
+        """Build an array from scalar appearance record instances."""
+        array = cls(recordClass, len(records))
+        words = array.words
+        for idx, record in enumerate(records):
+            word = 0
+            for name, shift, mask in recordClass._LAYOUT:
+                word |= (getattr(record, name) & mask) << shift
+            words[idx] = word
+        return array
+
+    def toRecords(self) -> list:
+        """Expand back into one scalar record instance per entity."""
+        buffer = self.toBytes()
+        fromBuffer = self.recordClass.fromBuffer
+        return [fromBuffer(buffer, 4 * idx) for idx in range(len(self))]
+
+    def decodeFields(self) -> "dict[str, numpy.ndarray]":
+        """Unpack every bit field into its own column.
+
+        One shift-and-mask pass over the word column per field; numpy
+        runs each as a vectorized elementwise op.
+        """
+        words = self.words
+        return {
+            name: (words >> numpy.uint32(shift)) & numpy.uint32(mask)
+            for name, shift, mask in self.recordClass._LAYOUT
+        }
+
+    def encodeFields(self, fields: "dict[str, numpy.ndarray]") -> None:
+        """Pack per-field columns back into the word column.
+
+        Fields not present in `fields` are packed as zero.
+        """
+        words = numpy.zeros(len(self), dtype=numpy.uint32)
+        for name, shift, mask in self.recordClass._LAYOUT:
+            if name in fields:
+                values = numpy.asarray(fields[name], dtype=numpy.uint32)
+                words |= (values & numpy.uint32(mask)) << numpy.uint32(shift)
+        self.words = words
+
+    def getField(self, name: str) -> "numpy.ndarray":
+        """Return one bit field across all entities."""
+        shift, mask = self._layout[name]
+        return (self.words >> numpy.uint32(shift)) & numpy.uint32(mask)
+
+    def setField(self, name: str, values) -> None:
+        """Set one bit field across all entities."""
+        shift, mask = self._layout[name]
+        cleared = self.words & numpy.uint32(~(mask << shift) & 0xFFFFFFFF)
+        self.words = cleared | (
+            (numpy.asarray(values, dtype=numpy.uint32) & numpy.uint32(mask))
+            << numpy.uint32(shift))
@@ -2,6 +2,9 @@
 #This code is licensed under the BSD software license
 #
 
+import struct
+
+from .appearance import getEntityAppearanceClass
 from .types import (
     enum8,
     enum16,
@@ -47,22 +50,24 @@ class DataQueryDatumSpecification:
         """serialize the class"""
         outputStream.write_unsigned_int(self.numberOfFixedDatumIDs)
         outputStream.write_unsigned_int(self.numberOfVariableDatumIDs)
-        for datumID in self.fixedDatumIDs:
-            outputStream.write_unsigned_int(datumID)
-
-        for datumID in self.variableDatumIDs:
-            outputStream.write_unsigned_int(datumID)
+        # Both ID lists are homogeneous uint32 arrays; pack each in one call.
+        outputStream.write_bytes(struct.pack(
+            '>%dI' % self.numberOfFixedDatumIDs, *self.fixedDatumIDs))
+        outputStream.write_bytes(struct.pack(
+            '>%dI' % self.numberOfVariableDatumIDs, *self.variableDatumIDs))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
         numberOfFixedDatumIDs = inputStream.read_unsigned_int()
         numberOfVariableDatumIDs = inputStream.read_unsigned_int()
-        for idx in range(0, numberOfFixedDatumIDs):
-            datumID = inputStream.read_unsigned_int()
-            self.fixedDatumIDs.append(datumID)
-        for idx in range(0, numberOfVariableDatumIDs):
-            datumID = inputStream.read_unsigned_int()
-            self.variableDatumIDs.append(datumID)
+        # Both ID lists are homogeneous uint32 arrays; read each block of
+        # bytes once and unpack all IDs in a single call.
+        self.fixedDatumIDs.extend(struct.unpack(
+            '>%dI' % numberOfFixedDatumIDs,
+            inputStream.read_bytes(4 * numberOfFixedDatumIDs)))
+        self.variableDatumIDs.extend(struct.unpack(
+            '>%dI' % numberOfVariableDatumIDs,
+            inputStream.read_bytes(4 * numberOfVariableDatumIDs)))
 
 
 class RadioIdentifier:
@@ -117,6 +122,11 @@ class RequestID:
         self.requestID = inputStream.read_unsigned_int()
 
 
+# Size of the record type (32 bits) and record length (16 bits) fields that
+# lead every IFF Data record; the record length includes them.
+_IFF_DATA_HEADER_SIZE = 6
+
+
 class IFFData:
     """Section 6.2.43
 
@@ -136,22 +146,16 @@ class IFFData:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_int(self.recordType)
-        outputStream.write_unsigned_short(len(self.iffData))
-        for anObj in self.iffData:
-            outputStream.write_unsigned_byte(anObj)
+        outputStream.write_record_header(
+            self.recordType, len(self.iffData) + _IFF_DATA_HEADER_SIZE)
+        outputStream.write_bytes(bytes(self.iffData))
         """TODO add padding to end on 32-bit boundary"""
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.recordType = inputStream.read_unsigned_int()
-        self.recordLength = inputStream.read_unsigned_short()
-        # The record length includes the length of record type field (32 bits)
-        # and record length field (16 bits) so we subtract 6 bytes total for
-        # those
-        for idx in range(0, self.recordLength - 6):
-            val = inputStream.read_unsigned_byte()
-            self.iffData.append(val)
+        self.recordType, self.recordLength = inputStream.read_record_header()
+        self.iffData.extend(inputStream.read_bytes(
+            max(self.recordLength - _IFF_DATA_HEADER_SIZE, 0)))
 
 
 class MunitionDescriptor:
@@ -216,6 +220,12 @@ class MinefieldSensorType:
         self.sensorType = inputStream.read_unsigned_short()
 
 
+# Shared layout of the 48-bit identifier records: a simulation address
+# (site, application) followed by one 16-bit number. Serializing through
+# one pack keeps each identifier to a single stream call.
+_IDENTIFIER_RECORD_STRUCT = struct.Struct('>HHH')
+
+
 class GroupID:
     """Section 6.2.43
 
@@ -226,20 +236,28 @@ class GroupID:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  groupNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Simulation address (site and application number)"""
         self.groupNumber = groupNumber
         """group number"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.groupNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.groupNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.groupNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.groupNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class LayerHeader:
@@ -583,18 +601,31 @@ class MinefieldIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  minefieldNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         self.minefieldNumber = minefieldNumber
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.minefieldNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.minefieldNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.minefieldNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.minefieldNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
+
+
+# Fixed big-endian layout of the RadioType record, precompiled once so
+# serialize/parse cost a single pack/unpack instead of seven stream calls.
+_RADIO_TYPE_STRUCT = struct.Struct('>BBHBBBB')
 
 
 class RadioType:
@@ -603,6 +634,8 @@ class RadioType:
     Identifies the type of radio.
     """
     entityKind: enum8 = 7  # [UID 7]
+    MARSHALLED_SIZE = 8
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  domain: enum8 = 0,  # [UID 8]
@@ -624,23 +657,25 @@ class RadioType:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.entityKind)
-        outputStream.write_unsigned_byte(self.domain)
-        outputStream.write_unsigned_short(self.country)
-        outputStream.write_unsigned_byte(self.category)
-        outputStream.write_unsigned_byte(self.subcategory)
-        outputStream.write_unsigned_byte(self.specific)
-        outputStream.write_unsigned_byte(self.extra)
+        outputStream.write_bytes(_RADIO_TYPE_STRUCT.pack(
+            self.entityKind,
+            self.domain,
+            self.country,
+            self.category,
+            self.subcategory,
+            self.specific,
+            self.extra))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.entityKind = inputStream.read_unsigned_byte()
-        self.domain = inputStream.read_unsigned_byte()
-        self.country = inputStream.read_unsigned_short()
-        self.category = inputStream.read_unsigned_byte()
-        self.subcategory = inputStream.read_unsigned_byte()
-        self.specific = inputStream.read_unsigned_byte()
-        self.extra = inputStream.read_unsigned_byte()
+        (self.entityKind,
+         self.domain,
+         self.country,
+         self.category,
+         self.subcategory,
+         self.specific,
+         self.extra) = _RADIO_TYPE_STRUCT.unpack(
+            inputStream.read_bytes(_RADIO_TYPE_STRUCT.size))
 
 
 class NamedLocationIdentification:
@@ -686,12 +721,19 @@ class ModulationParameters:
         """Parse a message. This may recursively call embedded objects."""
 
 
+# Three big-endian float32s, shared by EulerAngles and Vector3Float.
+_THREE_FLOATS_STRUCT = struct.Struct('>fff')
+
+
 class EulerAngles:
     """Section 6.2.33
 
     Three floating point values representing an orientation, psi, theta,
     and phi, aka the euler angles, in radians.
     """
+    __slots__ = ('psi', 'theta', 'phi')
+    MARSHALLED_SIZE = 12
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  psi: float32 = 0.0,
@@ -703,15 +745,13 @@ class EulerAngles:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_float(self.psi)
-        outputStream.write_float(self.theta)
-        outputStream.write_float(self.phi)
+        outputStream.write_bytes(
+            _THREE_FLOATS_STRUCT.pack(self.psi, self.theta, self.phi))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.psi = inputStream.read_float()
-        self.theta = inputStream.read_float()
-        self.phi = inputStream.read_float()
+        self.psi, self.theta, self.phi = _THREE_FLOATS_STRUCT.unpack(
+            inputStream.read_bytes(_THREE_FLOATS_STRUCT.size))
 
 
 class DirectedEnergyPrecisionAimpoint:
@@ -851,12 +891,22 @@ class OwnershipStatus:
         self.padding = inputStream.read_unsigned_byte()
 
 
+# Everything in a BeamAntennaPattern after the beam direction record: a
+# fixed 28-byte big-endian layout read/written in one call.
+_BEAM_ANTENNA_PATTERN_TAIL_STRUCT = struct.Struct('>ffBBHfffI')
+
+
 class BeamAntennaPattern:
     """Section 6.2.9.2
-    
+
     Used when the antenna pattern type field has a value of 1. Specifies the
     direction, pattern, and polarization of radiation from an antenna.
     """
+    __slots__ = ('beamDirection', 'azimuthBeamwidth', 'elevationBeamwidth',
+                 'referenceSystem', 'padding1', 'padding2', 'ez', 'ex',
+                 'phase', 'padding3')
+    MARSHALLED_SIZE = 40
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  beamDirection: "EulerAngles | None" = None,
@@ -866,7 +916,7 @@ class BeamAntennaPattern:
                  ez: float32 = 0.0,
                  ex: float32 = 0.0,
                  phase: float32 = 0.0):  # in radians
-        self.beamDirection = EulerAngles()
+        self.beamDirection = beamDirection or EulerAngles()
         """The rotation that transforms the reference coordinate sytem into the beam coordinate system. Either world coordinates or entity coordinates may be used as the reference coordinate system, as specified by the reference system field of the antenna pattern record."""
         self.azimuthBeamwidth = azimuthBeamwidth
         self.elevationBeamwidth = elevationBeamwidth
@@ -884,36 +934,45 @@ class BeamAntennaPattern:
     def serialize(self, outputStream):
         """serialize the class"""
         self.beamDirection.serialize(outputStream)
-        outputStream.write_float(self.azimuthBeamwidth)
-        outputStream.write_float(self.elevationBeamwidth)
-        outputStream.write_unsigned_byte(self.referenceSystem)
-        outputStream.write_unsigned_byte(self.padding1)
-        outputStream.write_unsigned_short(self.padding2)
-        outputStream.write_float(self.ez)
-        outputStream.write_float(self.ex)
-        outputStream.write_float(self.phase)
-        outputStream.write_unsigned_int(self.padding3)
+        outputStream.write_bytes(_BEAM_ANTENNA_PATTERN_TAIL_STRUCT.pack(
+            self.azimuthBeamwidth,
+            self.elevationBeamwidth,
+            self.referenceSystem,
+            self.padding1,
+            self.padding2,
+            self.ez,
+            self.ex,
+            self.phase,
+            self.padding3))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
         self.beamDirection.parse(inputStream)
-        self.azimuthBeamwidth = inputStream.read_float()
-        self.elevationBeamwidth = inputStream.read_float()
-        self.referenceSystem = inputStream.read_unsigned_byte()
-        self.padding1 = inputStream.read_unsigned_byte()
-        self.padding2 = inputStream.read_unsigned_short()
-        self.ez = inputStream.read_float()
-        self.ex = inputStream.read_float()
-        self.phase = inputStream.read_float()
-        self.padding3 = inputStream.read_unsigned_int()
+        (self.azimuthBeamwidth,
+         self.elevationBeamwidth,
+         self.referenceSystem,
+         self.padding1,
+         self.padding2,
+         self.ez,
+         self.ex,
+         self.phase,
+         self.padding3) = _BEAM_ANTENNA_PATTERN_TAIL_STRUCT.unpack(
+            inputStream.read_bytes(_BEAM_ANTENNA_PATTERN_TAIL_STRUCT.size))
+
+
+# Head of the 16-byte Attached Parts record, before the attached part type:
+# record type, detached indicator, part attached to and parameter type.
+_ATTACHED_PARTS_HEAD_STRUCT = struct.Struct('>BBHI')
 
 
 class AttachedParts:
     """Section 6.2.93.3
-    
+
     Removable parts that may be attached to an entity.
     """
     recordType: enum8 = 1  # [UID 56]  Variable Parameter Record Type
+    MARSHALLED_SIZE = 16
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  detachedIndicator: enum8 = 0,  # [UID 415]
@@ -926,24 +985,28 @@ class AttachedParts:
         """the identification of the articulated part to which this articulation parameter is attached. This field shall be specified by a 16-bit unsigned integer. This field shall contain the value zero if the articulated part is attached directly to the entity."""
         self.parameterType = parameterType
         """The location or station to which the part is attached"""
-        self.attachedPartType = attachedPartType or EntityType()
+        self.attachedPartType = (attachedPartType
+                                 if attachedPartType is not None
+                                 else EntityType())
         """The definition of the 64 bits shall be determined based on the type of parameter specified in the Parameter Type field"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.recordType)
-        outputStream.write_unsigned_byte(self.detachedIndicator)
-        outputStream.write_unsigned_short(self.partAttachedTo)
-        outputStream.write_unsigned_int(self.parameterType)
-        outputStream.write_long(self.parameterValue)
+        outputStream.write_bytes(_ATTACHED_PARTS_HEAD_STRUCT.pack(
+            self.recordType,
+            self.detachedIndicator,
+            self.partAttachedTo,
+            self.parameterType))
+        self.attachedPartType.serialize(outputStream)
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.recordType = inputStream.read_unsigned_byte()  # TODO: validate
-        self.detachedIndicator = inputStream.read_unsigned_byte()
-        self.partAttachedTo = inputStream.read_unsigned_short()
-        self.parameterType = inputStream.read_unsigned_int()
-        self.parameterValue = inputStream.read_long()
+        (self.recordType,  # TODO: validate
+         self.detachedIndicator,
+         self.partAttachedTo,
+         self.parameterType) = _ATTACHED_PARTS_HEAD_STRUCT.unpack(
+            inputStream.read_bytes(_ATTACHED_PARTS_HEAD_STRUCT.size))
+        self.attachedPartType.parse(inputStream)
 
 
 class VariableTransmitterParameters:
@@ -1015,15 +1078,21 @@ class RecordQuerySpecification:
     def serialize(self, outputStream):
         """serialize the class"""
         outputStream.write_unsigned_int(self.numberOfRecords)
-        for anObj in self.recordIDs:
-            outputStream.write_unsigned_int(anObj)
+        # The ID list is a homogeneous uint32 array; pack it in one call.
+        outputStream.write_bytes(struct.pack(
+            '>%dI' % self.numberOfRecords, *self.recordIDs))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
         numberOfRecords = inputStream.read_unsigned_int()
-        for idx in range(0, numberOfRecords):
-            val = inputStream.read_unsigned_int()
-            self.recordIDs.append(val)
+        # The ID list is a homogeneous uint32 array; unpack it in one call.
+        self.recordIDs.extend(struct.unpack(
+            '>%dI' % numberOfRecords,
+            inputStream.read_bytes(4 * numberOfRecords)))
+
+
+# The fixed 16-byte Articulated Parts record layout.
+_ARTICULATED_PARTS_STRUCT = struct.Struct('>BBHIq')
 
 
 class ArticulatedParts:
@@ -1033,6 +1102,8 @@ class ArticulatedParts:
     parts of an entity.
     """
     recordType: enum8 = 0  # [UID 56] Variable Parameter Record Type
+    MARSHALLED_SIZE = 16
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  changeIndicator: uint8 = 0,
@@ -1050,19 +1121,21 @@ class ArticulatedParts:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.recordType)
-        outputStream.write_unsigned_byte(self.changeIndicator)
-        outputStream.write_unsigned_short(self.partAttachedTo)
-        outputStream.write_unsigned_int(self.parameterType)
-        outputStream.write_long(self.parameterValue)
+        outputStream.write_bytes(_ARTICULATED_PARTS_STRUCT.pack(
+            self.recordType,
+            self.changeIndicator,
+            self.partAttachedTo,
+            self.parameterType,
+            self.parameterValue))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.recordType = inputStream.read_unsigned_byte()  # TODO: validate
-        self.changeIndicator = inputStream.read_unsigned_byte()
-        self.partAttachedTo = inputStream.read_unsigned_short()
-        self.parameterType = inputStream.read_unsigned_int()
-        self.parameterValue = inputStream.read_long()
+        (self.recordType,  # TODO: validate
+         self.changeIndicator,
+         self.partAttachedTo,
+         self.parameterType,
+         self.parameterValue) = _ARTICULATED_PARTS_STRUCT.unpack(
+            inputStream.read_bytes(_ARTICULATED_PARTS_STRUCT.size))
 
 
 class ObjectType:
@@ -1215,20 +1288,28 @@ class ObjectIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  objectNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Simulation Address"""
         self.objectNumber = objectNumber
         """object number"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.objectNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.objectNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.objectNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.objectNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class AggregateIdentifier:
@@ -1240,19 +1321,27 @@ class AggregateIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  aggregateID: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Simulation address, ie site and application, the first two fields of the entity ID"""
         self.aggregateID = aggregateID
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.aggregateID)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.aggregateID))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.aggregateID = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.aggregateID) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class FixedDatum:
@@ -1280,12 +1369,24 @@ class FixedDatum:
         self.fixedDatumValue = inputStream.read_unsigned_int()
 
 
+# The 16-byte Variable Parameter record: record type followed by the four
+# variable parameter data fields.
+_VARIABLE_PARAMETER_STRUCT = struct.Struct('>BdIHB')
+
+
 class VariableParameter:
     """Section 6.2.94.1
 
     Specification of additional information associated with an entity or
     detonation, not otherwise accounted for in a PDU.
     """
+    MARSHALLED_SIZE = 16
+    """Size of this record on the wire, in bytes."""
+    __slots__ = ('recordType',
+                 'variableParameterFields1',
+                 'variableParameterFields2',
+                 'variableParameterFields3',
+                 'variableParameterFields4')
 
     def __init__(self,
                  recordType: enum8 = 0,  # [UID 56]
@@ -1306,19 +1407,63 @@ class VariableParameter:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.recordType)
-        outputStream.write_double(self.variableParameterFields1)
-        outputStream.write_unsigned_int(self.variableParameterFields2)
-        outputStream.write_unsigned_short(self.variableParameterFields3)
-        outputStream.write_unsigned_byte(self.variableParameterFields4)
+        outputStream.write_bytes(_VARIABLE_PARAMETER_STRUCT.pack(
+            self.recordType,
+            self.variableParameterFields1,
+            self.variableParameterFields2,
+            self.variableParameterFields3,
+            self.variableParameterFields4))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.recordType = inputStream.read_unsigned_byte()
-        self.variableParameterFields1 = inputStream.read_double()
-        self.variableParameterFields2 = inputStream.read_unsigned_int()
-        self.variableParameterFields3 = inputStream.read_unsigned_short()
-        self.variableParameterFields4 = inputStream.read_unsigned_byte()
+        (self.recordType,
+         self.variableParameterFields1,
+         self.variableParameterFields2,
+         self.variableParameterFields3,
+         self.variableParameterFields4) = _VARIABLE_PARAMETER_STRUCT.unpack(
+            inputStream.read_bytes(_VARIABLE_PARAMETER_STRUCT.size))
+
+
+# Variable parameter record classes by record type [UID 56]. PDU parsing
+# always produces generic VariableParameter records; this registry is a
+# lookup helper for callers that want to reinterpret a record by type.
+_variableParameterClasses: dict = {
+    0: ArticulatedParts,
+    1: AttachedParts,
+}
+
+
+def getVariableParameterClass(recordType: enum8) -> type:
+    """Return the class registered for a Variable Parameter record type
+    [UID 56], falling back to the generic VariableParameter.
+
+    This is a lookup helper only: PDU parsing keeps every record as a
+    generic VariableParameter regardless of type.
+    """
+    return _variableParameterClasses.get(recordType, VariableParameter)
+
+
+def registerVariableParameterClass(recordType, vpClass):
+    """Register a class for a Variable Parameter record type, so
+    getVariableParameterClass resolves to it. Does not change how PDUs
+    parse the records."""
+    _variableParameterClasses[recordType] = vpClass
+
+
+def _parseVariableParameters(inputStream, count: int) -> list:
+    """Parse a block of `count` Variable Parameter records.
+
+    The records are fixed 16-byte, so the whole block is read in one call
+    and decoded with one C-level iter_unpack instead of per-record,
+    per-field stream reads. Every record comes back as the generic
+    VariableParameter; use getVariableParameterClass to reinterpret one
+    by its record type.
+    """
+    return [
+        VariableParameter(*fields)
+        for fields in _VARIABLE_PARAMETER_STRUCT.iter_unpack(
+            inputStream.read_bytes(_VARIABLE_PARAMETER_STRUCT.size * count))
+    ]
 
 
 class ChangeOptions:
@@ -1337,12 +1482,16 @@ class ChangeOptions:
         pass
 
 
+_LIVE_SIMULATION_ADDRESS_STRUCT = struct.Struct('>BB')
+
+
 class LiveSimulationAddress:
     """Section 6.2.55
 
     A simulation's designation associated with all Live Entity IDs contained in
     Live Entity PDUs.
     """
+    __slots__ = ('liveSiteNumber', 'liveApplicationNumber')
 
     def __init__(self,
                  liveSiteNumber: uint8 = 0,
@@ -1354,13 +1503,14 @@ class LiveSimulationAddress:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.liveSiteNumber)
-        outputStream.write_unsigned_byte(self.liveApplicationNumber)
+        outputStream.write_bytes(_LIVE_SIMULATION_ADDRESS_STRUCT.pack(
+            self.liveSiteNumber, self.liveApplicationNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.liveSiteNumber = inputStream.read_unsigned_byte()
-        self.liveApplicationNumber = inputStream.read_unsigned_byte()
+        (self.liveSiteNumber,
+         self.liveApplicationNumber) = _LIVE_SIMULATION_ADDRESS_STRUCT.unpack(
+            inputStream.read_bytes(2))
 
 
 class EntityMarking:
@@ -1391,16 +1541,14 @@ class EntityMarking:
     def serialize(self, outputStream):
         """serialize the class"""
         outputStream.write_unsigned_byte(self.characterSet)
-        for idx in range(0, 11):
-            outputStream.write_byte(self.characters[idx])
+        # The marking text is a fixed 11-byte block; write it in one
+        # call, zero-padded if fewer characters were supplied.
+        outputStream.write_bytes(bytes(self.characters[:11]).ljust(11, b'\x00'))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
         self.characterSet = inputStream.read_unsigned_byte()
-        self.characters = [0] * 11
-        for idx in range(0, 11):
-            val = inputStream.read_byte()
-            self.characters[idx] = val
+        self.characters = list(inputStream.read_bytes(11))
 
 
 class UAFundamentalParameter:
@@ -1449,6 +1597,13 @@ class UAFundamentalParameter:
         self.beamwidthDownElevation = inputStream.read_float()
 
 
+# Fixed sections of the Directed Energy Damage record: the record header
+# (type, length, padding) and the fields between the nested damage
+# location and fire event ID records.
+_DE_DAMAGE_HEAD_STRUCT = struct.Struct('>IHH')
+_DE_DAMAGE_MID_STRUCT = struct.Struct('>ffBBBB')
+
+
 class DirectedEnergyDamage:
     """Section 6.2.15.2
     
@@ -1457,6 +1612,8 @@ class DirectedEnergyDamage:
     """
     recordType: enum32 = 4500  # [UID 66] Variable Record Type
     recordLength: uint16 = 40  # in bytes
+    MARSHALLED_SIZE = 40
+    """Size of this record on the wire, in bytes."""
 
     def __init__(
             self,
@@ -1465,11 +1622,12 @@ class DirectedEnergyDamage:
             temperature: float32 = -273.15,  # in degrees Celsius
             componentIdentification: enum8 = 0,  # [UID 314]
             componentDamageStatus: enum8 = 0,  # [UID 315]
-            componentVisualDamageStatus: struct8 = b'0',  # [UID 317]
+            componentVisualDamageStatus: struct8 = 0,  # [UID 317]
             componentVisualSmokeColor: enum8 = 0,  # [UID 316]
             fireEventID: "EventIdentifier | None" = None):
         self.padding: uint16 = 0
-        self.damageLocation = damageLocation or Vector3Float()
+        self.damageLocation = (damageLocation if damageLocation is not None
+                               else Vector3Float())
         """location of damage, relative to center of entity"""
         self.damageDiameter = damageDiameter
         """Size of damaged area, in meters."""
@@ -1483,37 +1641,40 @@ class DirectedEnergyDamage:
         """enumeration"""
         self.componentVisualSmokeColor = componentVisualSmokeColor
         """enumeration"""
-        self.fireEventID = fireEventID or EventIdentifier()
+        self.fireEventID = (fireEventID if fireEventID is not None
+                            else EventIdentifier())
         """For any component damage resulting this field shall be set to the fire event ID from that PDU."""
         self.padding2: uint16 = 0
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_int(self.recordType)
-        outputStream.write_unsigned_short(self.recordLength)
-        outputStream.write_unsigned_short(self.padding)
+        outputStream.write_bytes(_DE_DAMAGE_HEAD_STRUCT.pack(
+            self.recordType, self.recordLength, self.padding))
         self.damageLocation.serialize(outputStream)
-        outputStream.write_float(self.damageDiameter)
-        outputStream.write_float(self.temperature)
-        outputStream.write_unsigned_byte(self.componentIdentification)
-        outputStream.write_unsigned_byte(self.componentDamageStatus)
-        outputStream.write_unsigned_byte(self.componentVisualDamageStatus)
-        outputStream.write_unsigned_byte(self.componentVisualSmokeColor)
+        outputStream.write_bytes(_DE_DAMAGE_MID_STRUCT.pack(
+            self.damageDiameter,
+            self.temperature,
+            self.componentIdentification,
+            self.componentDamageStatus,
+            self.componentVisualDamageStatus,
+            self.componentVisualSmokeColor))
         self.fireEventID.serialize(outputStream)
         outputStream.write_unsigned_short(self.padding2)
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.recordType = inputStream.read_unsigned_int()  # TODO: validate
-        self.recordLength = inputStream.read_unsigned_short()  # TODO: validate
-        self.padding = inputStream.read_unsigned_short()
+        (self.recordType,  # TODO: validate
+         self.recordLength,  # TODO: validate
+         self.padding) = _DE_DAMAGE_HEAD_STRUCT.unpack(
+            inputStream.read_bytes(_DE_DAMAGE_HEAD_STRUCT.size))
         self.damageLocation.parse(inputStream)
-        self.damageDiameter = inputStream.read_float()
-        self.temperature = inputStream.read_float()
-        self.componentIdentification = inputStream.read_unsigned_byte()
-        self.componentDamageStatus = inputStream.read_unsigned_byte()
-        self.componentVisualDamageStatus = inputStream.read_unsigned_byte()
-        self.componentVisualSmokeColor = inputStream.read_unsigned_byte()
+        (self.damageDiameter,
+         self.temperature,
+         self.componentIdentification,
+         self.componentDamageStatus,
+         self.componentVisualDamageStatus,
+         self.componentVisualSmokeColor) = _DE_DAMAGE_MID_STRUCT.unpack(
+            inputStream.read_bytes(_DE_DAMAGE_MID_STRUCT.size))
         self.fireEventID.parse(inputStream)
         self.padding2 = inputStream.read_unsigned_short()
 
@@ -1588,8 +1749,8 @@ class SecondaryOperationalData:
     """
 
     def __init__(self,
-                 operationalData1: struct8 = b'0',
-                 operationalData2: struct8 = b'0',
+                 operationalData1: struct8 = 0,
+                 operationalData2: struct8 = 0,
                  numberOfIFFFundamentalParameterRecords: uint16 = 0):
         self.operationalData1 = operationalData1
         """additional operational characteristics of the IFF emitting system. Each 8-bit field will vary depending on the system type."""
@@ -1688,20 +1849,28 @@ class MineEntityIdentifier:
     """
 
     def __init__(self, simulationAddress: "SimulationAddress | None" = None, mineEntityNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """"""
         self.mineEntityNumber = mineEntityNumber
         """"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.mineEntityNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.mineEntityNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.mineEntityNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.mineEntityNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class Relationship:
@@ -1931,6 +2100,9 @@ class Vector3Float:
     
     Three floating point values, x, y, and z.
     """
+    __slots__ = ('x', 'y', 'z')
+    MARSHALLED_SIZE = 12
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self, x: float32 = 0.0, y: float32 = 0.0, z: float32 = 0.0):
         self.x = x
@@ -1939,15 +2111,13 @@ class Vector3Float:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_float(self.x)
-        outputStream.write_float(self.y)
-        outputStream.write_float(self.z)
+        outputStream.write_bytes(
+            _THREE_FLOATS_STRUCT.pack(self.x, self.y, self.z))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.x = inputStream.read_float()
-        self.y = inputStream.read_float()
-        self.z = inputStream.read_float()
+        self.x, self.y, self.z = _THREE_FLOATS_STRUCT.unpack(
+            inputStream.read_bytes(_THREE_FLOATS_STRUCT.size))
 
 
 class Expendable:
@@ -2018,11 +2188,19 @@ class IOCommunicationsNode:
         self.communicationsNodeID.parse(inputStream)
 
 
+# The ModulationType record is four big-endian uint16s, including the
+# spread spectrum bitfield; precompiled so it moves in one call.
+_MODULATION_TYPE_STRUCT = struct.Struct('>HHHH')
+
+
 class ModulationType:
     """Section 6.2.59
-    
+
     Information about the type of modulation used for radio transmission.
     """
+    __slots__ = ('spreadSpectrum', 'majorModulation', 'detail', 'radioSystem')
+    MARSHALLED_SIZE = 8
+    """Size of this record on the wire, in bytes."""
 
     def __init__(self,
                  spreadSpectrum: struct16 = 0,  # See RPR Enumerations
@@ -2038,19 +2216,47 @@ class ModulationType:
         self.radioSystem = radioSystem
         """the radio system associated with this Transmitter PDU and shall be used as the basis to interpret other fields whose values depend on a specific radio system."""
 
+    # The spread spectrum field is kept packed; these properties expose its
+    # technique flags without any per-flag marshalling cost.
+    @property
+    def frequencyHopping(self) -> bool:
+        return bool(self.spreadSpectrum & 1)
+
+    @frequencyHopping.setter
+    def frequencyHopping(self, value: bool):
+        self.spreadSpectrum = (self.spreadSpectrum & ~1) | bool(value)
+
+    @property
+    def pseudoNoise(self) -> bool:
+        return bool(self.spreadSpectrum & 2)
+
+    @pseudoNoise.setter
+    def pseudoNoise(self, value: bool):
+        self.spreadSpectrum = (self.spreadSpectrum & ~2) | (bool(value) << 1)
+
+    @property
+    def timeHopping(self) -> bool:
+        return bool(self.spreadSpectrum & 4)
+
+    @timeHopping.setter
+    def timeHopping(self, value: bool):
+        self.spreadSpectrum = (self.spreadSpectrum & ~4) | (bool(value) << 2)
+
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_short(self.spreadSpectrum)
-        outputStream.write_unsigned_short(self.majorModulation)
-        outputStream.write_unsigned_short(self.detail)
-        outputStream.write_unsigned_short(self.radioSystem)
+        outputStream.write_bytes(_MODULATION_TYPE_STRUCT.pack(
+            self.spreadSpectrum,
+            self.majorModulation,
+            self.detail,
+            self.radioSystem))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.spreadSpectrum = inputStream.read_unsigned_short()
-        self.majorModulation = inputStream.read_unsigned_short()
-        self.detail = inputStream.read_unsigned_short()
-        self.radioSystem = inputStream.read_unsigned_short()
+        (self.spreadSpectrum,
+         self.majorModulation,
+         self.detail,
+         self.radioSystem) = _MODULATION_TYPE_STRUCT.unpack(
+            inputStream.read_bytes(_MODULATION_TYPE_STRUCT.size))
 
 
 class LinearSegmentParameter:
@@ -2122,12 +2328,16 @@ class LinearSegmentParameter:
         self.padding = inputStream.read_unsigned_int()
 
 
+_SIMULATION_ADDRESS_STRUCT = struct.Struct('>HH')
+
+
 class SimulationAddress:
     """Section 6.2.79
     
     A Simulation Address record shall consist of the Site Identification number
     and the Application Identification number.
     """
+    __slots__ = ('site', 'application')
 
     def __init__(self,
                  site: uint16 = 0,
@@ -2139,13 +2349,14 @@ class SimulationAddress:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_short(self.site)
-        outputStream.write_unsigned_short(self.application)
+        outputStream.write_bytes(_SIMULATION_ADDRESS_STRUCT.pack(
+            self.site, self.application))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.site = inputStream.read_unsigned_short()
-        self.application = inputStream.read_unsigned_short()
+        (self.site,
+         self.application) = _SIMULATION_ADDRESS_STRUCT.unpack(
+            inputStream.read_bytes(4))
 
 
 class SystemIdentifier:
@@ -2435,20 +2646,28 @@ class SimulationIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  referenceNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Simulation address"""
         self.referenceNumber = referenceNumber
         """This field shall be set to zero as there is no reference number associated with a Simulation Identifier."""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.referenceNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.referenceNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.referenceNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.referenceNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class GridAxisDescriptorVariable:
@@ -2558,6 +2777,7 @@ class SilentEntitySystem:
     
     Information abou an entity not producing espdus.
     """
+    __slots__ = ('numberOfEntities', 'entityType', 'appearanceRecordList')
 
     def __init__(self,
                  numberOfEntities: uint16 = 0,
@@ -2565,8 +2785,11 @@ class SilentEntitySystem:
                  appearanceRecordList: list | None = None):
         self.numberOfEntities = numberOfEntities
         """number of the type specified by the entity type field"""
-        self.entityType = entityType or EntityType()
-        self.appearanceRecordList = appearanceRecordList or []
+        self.entityType = (entityType if entityType is not None
+                           else EntityType())
+        self.appearanceRecordList = (appearanceRecordList
+                                     if appearanceRecordList is not None
+                                     else [])
         """Variable length list of appearance records"""
 
     @property
@@ -2586,10 +2809,19 @@ class SilentEntitySystem:
         self.numberOfEntities = inputStream.read_unsigned_short()
         numberOfAppearanceRecords = inputStream.read_unsigned_short()
         self.entityType.parse(inputStream)
-        for idx in range(0, numberOfAppearanceRecords):
-            element = null()
-            element.parse(inputStream)
-            self.appearanceRecordList.append(element)
+        # Each appearance record is a packed 32-bit word (6.2.26) whose
+        # layout depends on the entity kind and domain, which are the same
+        # for every record in the list.
+        appearanceClass = getEntityAppearanceClass(
+            self.entityType.entityKind, self.entityType.domain)
+        buffer = inputStream.read_bytes(4 * numberOfAppearanceRecords)
+        self.appearanceRecordList = [
+            appearanceClass.fromBuffer(buffer, 4 * idx)
+            for idx in range(numberOfAppearanceRecords)
+        ]
+
+
+_EVENT_IDENTIFIER_STRUCT = struct.Struct('>HHH')
 
 
 class EventIdentifier:
@@ -2598,23 +2830,32 @@ class EventIdentifier:
     Identifies an event in the world. Use this format for every PDU EXCEPT
     the LiveEntityPdu.
     """
+    __slots__ = ('simulationAddress', 'eventNumber')
 
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  eventNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Site and application IDs"""
         self.eventNumber = eventNumber
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.eventNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_EVENT_IDENTIFIER_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.eventNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.eventNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.eventNumber) = _EVENT_IDENTIFIER_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class BlankingSector:
@@ -2957,18 +3198,81 @@ class Munition:
         self.padding = inputStream.read_unsigned_byte()
 
 
+# Size of the record type (32 bits) and record length (16 bits) fields
+# leading every standard variable record; the record length includes them.
+_STANDARD_VARIABLE_HEADER_SIZE = 6
+
+
+class StandardVariableRecord:
+    """Section 6.2.82
+
+    Record type, record length, and the record-type-specific payload of a
+    standard variable record, kept as opaque bytes.
+    """
+
+    def __init__(self,
+                 recordType: enum32 = 0,  # [UID 66]
+                 recordData: bytes = b''):
+        self.recordType = recordType
+        """enumeration for the type of record"""
+        self.recordData = recordData
+        """record-type-specific fields, as raw bytes"""
+
+    @property
+    def recordLength(self) -> uint16:
+        return _STANDARD_VARIABLE_HEADER_SIZE + len(self.recordData)
+
+    def serialize(self, outputStream):
+        """serialize the class"""
+        outputStream.write_record_header(self.recordType, self.recordLength)
+        outputStream.write_bytes(self.recordData)
+
+    def parse(self, inputStream):
+        """Parse a message. This may recursively call embedded objects."""
+        self.recordType, recordLength = inputStream.read_record_header()
+        self.parseRecordData(inputStream, recordLength)
+
+    def parseRecordData(self, inputStream, recordLength: uint16):
+        """Parse the record-type-specific fields; the record header has
+        already been read. Subclasses override this to decode their layout."""
+        self.recordData = inputStream.read_bytes(
+            recordLength - _STANDARD_VARIABLE_HEADER_SIZE)
+
+
+# Standard variable record classes by record type [UID 66]. Classes not
+# registered here parse as the generic StandardVariableRecord.
+_standardVariableClasses: dict = {}
+
+
+def registerStandardVariableClass(recordType, svClass):
+    """Register a StandardVariableRecord subclass for a record type, so
+    StandardVariableSpecification.parse dispatches to it.
+
+    The subclass check happens here, once per registration, so the
+    per-record parse path can trust the map without re-checking.
+    """
+    if not issubclass(svClass, StandardVariableRecord):
+        raise TypeError(
+            "expected a StandardVariableRecord subclass, got %r" % (svClass,))
+    _standardVariableClasses[recordType] = svClass
+
+
+def getStandardVariableClass(recordType: enum32) -> type:
+    """Return the class for a standard variable record type [UID 66],
+    falling back to the generic StandardVariableRecord."""
+    return _standardVariableClasses.get(recordType, StandardVariableRecord)
+
+
 class StandardVariableSpecification:
     """Section 6.2.83
-    
-    Does not work, and causes failure in anything it is embedded in.
+
+    Number of standard variable records followed by the records themselves.
     """
 
     def __init__(self,
                  standardVariables: list | None = None):
         self.standardVariables = standardVariables or []
-        """variable length list of standard variables.
-        The class type and length here are WRONG and will cause the incorrect
-        serialization of any class in which it is embedded."""
+        """variable length list of standard variable records"""
 
     @property
     def numberOfStandardVariableRecords(self) -> uint16:
@@ -2982,12 +3286,17 @@ class StandardVariableSpecification:
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        numberOfStandardVariableRecords = inputStream.read_unsigned_short(
-        )
-        for idx in range(0, numberOfStandardVariableRecords):
-            element = null()
-            element.parse(inputStream)
-            self.standardVariables.append(element)
+        recordCount = inputStream.read_unsigned_short()
+        # Hot loop: preallocate the list and keep lookups local.
+        records = [None] * recordCount
+        recordClasses = _standardVariableClasses
+        defaultClass = StandardVariableRecord
+        for idx in range(recordCount):
+            recordType, recordLength = inputStream.read_record_header()
+            element = recordClasses.get(recordType, defaultClass)(recordType)
+            element.parseRecordData(inputStream, recordLength)
+            records[idx] = element
+        self.standardVariables = records
 
 
 class Vector2Float:
@@ -3422,20 +3731,28 @@ class EntityIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  entityNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """Site and application IDs"""
         self.entityNumber = entityNumber
         """Entity number"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.entityNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.entityNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.entityNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.entityNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class DirectedEnergyTargetEnergyDeposition:
@@ -3479,16 +3796,15 @@ class EntityID:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_short(self.siteID)
-        outputStream.write_unsigned_short(self.applicationID)
-        outputStream.write_unsigned_short(self.entityID)
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            self.siteID, self.applicationID, self.entityID))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-
-        self.siteID = inputStream.read_unsigned_short()
-        self.applicationID = inputStream.read_unsigned_short()
-        self.entityID = inputStream.read_unsigned_short()
+        (self.siteID,
+         self.applicationID,
+         self.entityID) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class EngineFuelReload:
@@ -3547,20 +3863,28 @@ class UnattachedIdentifier:
     def __init__(self,
                  simulationAddress: "SimulationAddress | None" = None,
                  referenceNumber: uint16 = 0):
-        self.simulationAddress = simulationAddress or SimulationAddress()
+        self.simulationAddress = (simulationAddress
+                                  if simulationAddress is not None
+                                  else SimulationAddress())
         """See 6.2.79"""
         self.referenceNumber = referenceNumber
         """Reference number"""
 
     def serialize(self, outputStream):
         """serialize the class"""
-        self.simulationAddress.serialize(outputStream)
-        outputStream.write_unsigned_short(self.referenceNumber)
+        simulationAddress = self.simulationAddress
+        outputStream.write_bytes(_IDENTIFIER_RECORD_STRUCT.pack(
+            simulationAddress.site,
+            simulationAddress.application,
+            self.referenceNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.simulationAddress.parse(inputStream)
-        self.referenceNumber = inputStream.read_unsigned_short()
+        simulationAddress = self.simulationAddress
+        (simulationAddress.site,
+         simulationAddress.application,
+         self.referenceNumber) = _IDENTIFIER_RECORD_STRUCT.unpack(
+            inputStream.read_bytes(6))
 
 
 class EntityTypeVP:
@@ -3786,8 +4110,9 @@ class VariableDatum:
         """Type of variable datum to be transmitted. 32 bit enumeration defined in EBV"""
         self.variableDatumLength = variableDatumLength
         """Length, IN BITS, of the variable datum."""
-        self.variableData = variableData or []
-        """Variable datum. This can be any number of bits long, depending on the datum."""
+        self.variableData = variableData or b''
+        """Variable datum, kept as opaque bytes. This can be any number of
+        bits long, depending on the datum."""
 
     def datumPaddingSizeInBits(self):
         padding = 0
@@ -3800,24 +4125,27 @@ class VariableDatum:
         """serialize the class"""
         outputStream.write_unsigned_int(self.variableDatumID)
         outputStream.write_unsigned_int(self.variableDatumLength)
-        for x in range(self.variableDatumLength // 8):  # length is in bits
-            outputStream.write_unsigned_byte(self.variableData[x])
-
-        #send padding
-        for x in range(self.datumPaddingSizeInBits() // 8):
-            outputStream.write_unsigned_byte(0)
+        # The datum payload is opaque; write it (and its padding) verbatim
+        # rather than one byte at a time, zero-filled out to the length
+        # the variableDatumLength field promises.
+        datumBytes = self.variableDatumLength // 8
+        outputStream.write_bytes(
+            bytes(self.variableData[:datumBytes]).ljust(datumBytes, b'\x00'))
+        outputStream.write_bytes(bytes(self.datumPaddingSizeInBits() // 8))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
         self.variableDatumID = inputStream.read_unsigned_int()
         self.variableDatumLength = inputStream.read_unsigned_int()
-        for x in range(self.variableDatumLength // 8):  # length is in bits
-            self.variableData.append(inputStream.read_unsigned_byte())
+        self.variableData = inputStream.read_bytes(
+            self.variableDatumLength // 8)  # length is in bits
 
         # Skip over padding
         # "This field shall be padded at the end to make the length a multiple of 64-bits."
-        for x in range(self.datumPaddingSizeInBits() // 8):
-            inputStream.read_unsigned_byte()
+        inputStream.read_bytes(self.datumPaddingSizeInBits() // 8)
+
+
+_EVENT_IDENTIFIER_LIVE_ENTITY_STRUCT = struct.Struct('>BBH')
 
 
 class EventIdentifierLiveEntity:
@@ -3826,6 +4154,7 @@ class EventIdentifierLiveEntity:
     Identifies an event in the world. Use this format for ONLY the
     LiveEntityPdu.
     """
+    __slots__ = ('siteNumber', 'applicationNumber', 'eventNumber')
 
     def __init__(self,
                  siteNumber: uint8 = 0,
@@ -3837,15 +4166,15 @@ class EventIdentifierLiveEntity:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.siteNumber)
-        outputStream.write_unsigned_byte(self.applicationNumber)
-        outputStream.write_unsigned_short(self.eventNumber)
+        outputStream.write_bytes(_EVENT_IDENTIFIER_LIVE_ENTITY_STRUCT.pack(
+            self.siteNumber, self.applicationNumber, self.eventNumber))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.siteNumber = inputStream.read_unsigned_byte()
-        self.applicationNumber = inputStream.read_unsigned_byte()
-        self.eventNumber = inputStream.read_unsigned_short()
+        (self.siteNumber,
+         self.applicationNumber,
+         self.eventNumber) = _EVENT_IDENTIFIER_LIVE_ENTITY_STRUCT.unpack(
+            inputStream.read_bytes(4))
 
 
 class PduHeader:
@@ -3862,7 +4191,7 @@ class PduHeader:
                  protocolFamily: enum8 = 0,  # [UID 5]
                  timestamp: uint32 = 0,  # (See 6.2.88)
                  pduLength: uint16 = 0,  # in bytes
-                 pduStatus: struct8 = b'0'):  # (See 6.2.67)
+                 pduStatus: struct8 = 0):  # (See 6.2.67)
         self.protocolVersion = protocolVersion
         """The version of the protocol. 5=DIS-1995, 6=DIS-1998, 7=DIS-2009."""
         self.exerciseID = exerciseID
@@ -3902,9 +4231,14 @@ class PduHeader:
         self.padding = inputStream.read_unsigned_byte()
 
 
+# The common PDU header written by every PDU: protocol version, exercise
+# ID, PDU type, protocol family, timestamp and length, in one layout.
+_PDU_HEADER_STRUCT = struct.Struct('>BBBBIH')
+
+
 class PduSuperclass:
     """Section 7.2.2
-    
+
     The superclass for all PDUs, including classic and Live Entity (LE) PDUs.
     This incorporates the PduHeader record.
     """
@@ -3931,21 +4265,23 @@ class PduSuperclass:
 
     def serialize(self, outputStream):
         """serialize the class"""
-        outputStream.write_unsigned_byte(self.protocolVersion)
-        outputStream.write_unsigned_byte(self.exerciseID)
-        outputStream.write_unsigned_byte(self.pduType)
-        outputStream.write_unsigned_byte(self.protocolFamily)
-        outputStream.write_unsigned_int(self.timestamp)
-        outputStream.write_unsigned_short(self.length)
+        outputStream.write_bytes(_PDU_HEADER_STRUCT.pack(
+            self.protocolVersion,
+            self.exerciseID,
+            self.pduType,
+            self.protocolFamily,
+            self.timestamp,
+            self.length))
 
     def parse(self, inputStream):
         """Parse a message. This may recursively call embedded objects."""
-        self.protocolVersion = inputStream.read_unsigned_byte()
-        self.exerciseID = inputStream.read_unsigned_byte()
-        self.pduType = inputStream.read_unsigned_byte()
-        self.protocolFamily = inputStream.read_unsigned_byte()
-        self.timestamp = inputStream.read_unsigned_int()
-        self.length = inputStream.read_unsigned_short()
+        (self.protocolVersion,
+         self.exerciseID,
+         self.pduType,
+         self.protocolFamily,
+         self.timestamp,
+         self.length) = _PDU_HEADER_STRUCT.unpack(
+            inputStream.read_bytes(_PDU_HEADER_STRUCT.size))
 
 
 class CommunicationsNodeID:
@@ -4125,7 +4461,7 @@ class PduStatus:
     a byte.
     """
 
-    def __init__(self, pduStatus: struct8 = b'0'):
+    def __init__(self, pduStatus: struct8 = 0):
         self.pduStatus = pduStatus
         """Bit fields. The semantics of the bit fields depend on the PDU type"""
 
@@ -4168,9 +4504,9 @@ class LiveEntityPdu(PduSuperclass):
 class Pdu(PduSuperclass):
     """Adds some fields to the the classic PDU"""
 
-    def __init__(self, pduStatus: "PduStatus | None" = None):  # (See 6.2.67)
+    def __init__(self, pduStatus: struct8 = 0):  # (See 6.2.67)
         super(Pdu, self).__init__()
-        self.pduStatus = pduStatus or PduStatus()
+        self.pduStatus = pduStatus
         """PDU Status Record. Described in 6.2.67. This field is not present in earlier DIS versions"""
         self.padding: uint8 = 0
         """zero-filled array of padding"""
@@ -4199,14 +4535,6 @@ class EntityInformationFamilyPdu(Pdu):
     def __init__(self):
         super(EntityInformationFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(EntityInformationFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(EntityInformationFamilyPdu, self).parse(inputStream)
-
 
 class LogisticsFamilyPdu(Pdu):
     """Section 7.4
@@ -4218,14 +4546,6 @@ class LogisticsFamilyPdu(Pdu):
     def __init__(self):
         super(LogisticsFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(LogisticsFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(LogisticsFamilyPdu, self).parse(inputStream)
-
 
 class EntityStateUpdatePdu(EntityInformationFamilyPdu):
     """Section 7.2.5
@@ -4240,7 +4560,7 @@ class EntityStateUpdatePdu(EntityInformationFamilyPdu):
                  entityLinearVelocity: "Vector3Float | None" = None,
                  entityLocation: "Vector3Double | None" = None,
                  entityOrientation: "EulerAngles | None" = None,
-                 entityAppearance: struct32 = b'0000',  # [UID 31-43]
+                 entityAppearance: struct32 = 0,  # [UID 31-43]
                  variableParameters: list["VariableParameter"] | None = None):
         super(EntityStateUpdatePdu, self).__init__()
         self.entityID = entityID or EntityID()
@@ -4284,10 +4604,8 @@ class EntityStateUpdatePdu(EntityInformationFamilyPdu):
         self.entityLocation.parse(inputStream)
         self.entityOrientation.parse(inputStream)
         self.entityAppearance = inputStream.read_unsigned_int()
-        for idx in range(0, numberOfVariableParameters):
-            element = VariableParameter()
-            element.parse(inputStream)
-            self.variableParameters.append(element)
+        self.variableParameters = _parseVariableParameters(
+            inputStream, numberOfVariableParameters)
 
 
 class ServiceRequestPdu(LogisticsFamilyPdu):
@@ -4390,14 +4708,6 @@ class SyntheticEnvironmentFamilyPdu(Pdu):
     def __init__(self):
         super(SyntheticEnvironmentFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(SyntheticEnvironmentFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(SyntheticEnvironmentFamilyPdu, self).parse(inputStream)
-
 
 class CollisionPdu(EntityInformationFamilyPdu):
     """Section 7.2.3
@@ -4603,8 +4913,6 @@ class LinearObjectStatePdu(SyntheticEnvironmentFamilyPdu):
         self.updateNumber = updateNumber
         """unique update number of each state transition of an object"""
         self.forceID = forceID
-        self.numberOfSegments = numberOfSegments
-        """number of linear segment parameters"""
         self.requesterID = requesterID or SimulationAddress()
         self.receivingID = receivingID or SimulationAddress()
         self.objectType = objectType or ObjectType()
@@ -4678,14 +4986,6 @@ class RadioCommunicationsFamilyPdu(Pdu):
     def __init__(self):
         super(RadioCommunicationsFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(RadioCommunicationsFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(RadioCommunicationsFamilyPdu, self).parse(inputStream)
-
 
 class IntercomSignalPdu(RadioCommunicationsFamilyPdu):
     """Section 7.7.5
@@ -4697,7 +4997,7 @@ class IntercomSignalPdu(RadioCommunicationsFamilyPdu):
     def __init__(self,
                  entityID: "EntityID | ObjectID | UnattachedIdentifier | None" = None,
                  communicationsDeviceID: uint16 = 0,
-                 encodingScheme: struct16 = b'00',
+                 encodingScheme: struct16 = 0,
                  tdlType: uint16 = 0,  # [UID 178]
                  sampleRate: uint32 = 0,
                  samples: uint16 = 0,
@@ -5042,14 +5342,6 @@ class DistributedEmissionsFamilyPdu(Pdu):
     def __init__(self):
         super(DistributedEmissionsFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(DistributedEmissionsFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(DistributedEmissionsFamilyPdu, self).parse(inputStream)
-
 
 class SimulationManagementWithReliabilityFamilyPdu(Pdu):
     """Section 5.3.12
@@ -5280,10 +5572,10 @@ class EntityStatePdu(EntityInformationFamilyPdu):
                  entityLinearVelocity: "Vector3Float | None" = None,
                  entityLocation: "Vector3Double | None" = None,
                  entityOrientation: "EulerAngles | None" = None,
-                 entityAppearance: struct32 = b'0000',  # [UID 31-43]
+                 entityAppearance: struct32 = 0,  # [UID 31-43]
                  deadReckoningParameters: "DeadReckoningParameters | None" = None,
                  marking: "EntityMarking | None" = None,
-                 capabilities: struct32 = b'0000',  # [UID 55]
+                 capabilities: struct32 = 0,  # [UID 55]
                  variableParameters: list["VariableParameter"] | None = None):
         super(EntityStatePdu, self).__init__()
         self.entityID = entityID or EntityID()
@@ -5351,10 +5643,8 @@ class EntityStatePdu(EntityInformationFamilyPdu):
         self.deadReckoningParameters.parse(inputStream)
         self.marking.parse(inputStream)
         self.capabilities = inputStream.read_unsigned_int()
-        for idx in range(0, numberOfVariableParameters):
-            element = VariableParameter()
-            element.parse(inputStream)
-            self.variableParameters.append(element)
+        self.variableParameters = _parseVariableParameters(
+            inputStream, numberOfVariableParameters)
 
 
 class EntityManagementFamilyPdu(Pdu):
@@ -5367,14 +5657,6 @@ class EntityManagementFamilyPdu(Pdu):
     def __init__(self):
         super(EntityManagementFamilyPdu, self).__init__()
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(EntityManagementFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(EntityManagementFamilyPdu, self).parse(inputStream)
-
 
 class StartResumePdu(SimulationManagementFamilyPdu):
     """Section 7.5.4
@@ -5435,7 +5717,7 @@ class TransmitterPdu(RadioCommunicationsFamilyPdu):
                  power: float32 = 0.0,  # in decibel-milliwatts
                  modulationType: "ModulationType | None" = None,
                  cryptoSystem: enum16 = 0,  # [UID 166]
-                 cryptoKeyId: struct16 = b'00',  # See Table 175
+                 cryptoKeyId: struct16 = 0,  # See Table 175
                  modulationParameterCount: uint8 = 0,  # in bytes
                  modulationParametersList=None,
                  antennaPatternList=None):
@@ -5841,14 +6123,6 @@ class MinefieldFamilyPdu(Pdu):
         super(MinefieldFamilyPdu, self).__init__()
         """initialize value"""
 
-    def serialize(self, outputStream):
-        """serialize the class"""
-        super(MinefieldFamilyPdu, self).serialize(outputStream)
-
-    def parse(self, inputStream):
-        """Parse a message. This may recursively call embedded objects."""
-        super(MinefieldFamilyPdu, self).parse(inputStream)
-
 
 class SetDataReliablePdu(SimulationManagementWithReliabilityFamilyPdu):
     """Section 5.3.12.9
@@ -5959,7 +6233,7 @@ class PointObjectStatePdu(SyntheticEnvironmentFamilyPdu):
                  objectType: "ObjectType | None" = None,
                  objectLocation: "Vector3Double | None" = None,
                  objectOrientation: "EulerAngles | None" = None,
-                 objectAppearance: struct32 | struct16 = b'0000',  # [UID 229]
+                 objectAppearance: struct32 | struct16 = 0,  # [UID 229]
                  requesterID: "SimulationAddress | None" = None,
                  receivingID: "SimulationAddress | None" = None):
         super(PointObjectStatePdu, self).__init__()
@@ -6302,10 +6576,8 @@ class FastEntityStatePdu(EntityInformationFamilyPdu):
             self.marking[idx] = val
 
         self.capabilities = inputStream.read_int()
-        for idx in range(0, self.numberOfVariableParameters):
-            element = VariableParameter()
-            element.parse(inputStream)
-            self.variableParameters.append(element)
+        self.variableParameters = _parseVariableParameters(
+            inputStream, self.numberOfVariableParameters)
 
 
 class AcknowledgeReliablePdu(SimulationManagementWithReliabilityFamilyPdu):
@@ -6402,8 +6674,8 @@ class ArealObjectStatePdu(SyntheticEnvironmentFamilyPdu):
                  forceId: enum8 = 0,  # [UID 6]
                  modifications: enum8 = 0,  # [UID 242]
                  objectType: "ObjectType | None" = None,
-                 specificObjectAppearance: struct32 = b'0000',
-                 generalObjectAppearance: struct16 = b'00',  # [UID 229]
+                 specificObjectAppearance: struct32 = 0,
+                 generalObjectAppearance: struct16 = 0,  # [UID 229]
                  requesterID: "SimulationAddress | None" = None,
                  receivingID: "SimulationAddress | None" = None,
                  objectLocation: list["Vector3Double"] | None = None):
@@ -6773,7 +7045,7 @@ class DirectedEnergyFirePdu(WarfareFamilyPdu):
                  peakIrradiance=0.0,
                  pulseRepetitionFrequency: float32 = 0.0,  # in Hz
                  pulseWidth: float32 = 0,  # in seconds
-                 flags: struct16 = b'00',  # [UID 313]
+                 flags: struct16 = 0,  # [UID 313]
                  pulseShape: enum8 = 0,  # [UID 312]
                  dERecords: list | None = None):
         super(DirectedEnergyFirePdu, self).__init__()
@@ -6816,7 +7088,7 @@ class DirectedEnergyFirePdu(WarfareFamilyPdu):
         super(DirectedEnergyFirePdu, self).serialize(outputStream)
         self.munitionType.serialize(outputStream)
         self.shotStartTime.serialize(outputStream)
-        outputStream.write_float(self.commulativeShotTime)
+        outputStream.write_float(self.cumulativeShotTime)
         self.apertureEmitterLocation.serialize(outputStream)
         outputStream.write_float(self.apertureDiameter)
         outputStream.write_float(self.wavelength)
@@ -6837,7 +7109,7 @@ class DirectedEnergyFirePdu(WarfareFamilyPdu):
         super(DirectedEnergyFirePdu, self).parse(inputStream)
         self.munitionType.parse(inputStream)
         self.shotStartTime.parse(inputStream)
-        self.commulativeShotTime = inputStream.read_float()
+        self.cumulativeShotTime = inputStream.read_float()
         self.apertureEmitterLocation.parse(inputStream)
         self.apertureDiameter = inputStream.read_float()
         self.wavelength = inputStream.read_float()
@@ -6922,10 +7194,8 @@ class DetonationPdu(WarfareFamilyPdu):
         self.detonationResult = inputStream.read_unsigned_byte()
         numberOfVariableParameters = inputStream.read_unsigned_byte()
         self.pad = inputStream.read_unsigned_short()
-        for idx in range(0, numberOfVariableParameters):
-            element = VariableParameter()
-            element.parse(inputStream)
-            self.variableParameters.append(element)
+        self.variableParameters = _parseVariableParameters(
+            inputStream, numberOfVariableParameters)
 
 
 class SetDataPdu(SimulationManagementFamilyPdu):
@@ -7244,7 +7514,7 @@ class UaPdu(DistributedEmissionsFamilyPdu):
                  eventID: "EventIdentifier | None" = None,
                  stateChangeIndicator: enum8 = 0,  # [UID 143]
                  passiveParameterIndex: enum16 = 0,  # [UID 148]
-                 propulsionPlantConfiguration: struct8 = b'0',  # [UID 149]
+                 propulsionPlantConfiguration: struct8 = 0,  # [UID 149]
                  shaftRPMs: list | None = None,  # positive = clockwise
                  apaData: list | None = None,
                  emitterSystems: list | None = None):
@@ -7337,7 +7607,7 @@ class IntercomControlPdu(RadioCommunicationsFamilyPdu):
 
     def __init__(self,
                  controlType: enum8 = 0,  # [UID 180]
-                 communicationsChannelType: struct8 = b'0',  # [UID 416], [UID 181]
+                 communicationsChannelType: struct8 = 0,  # [UID 416], [UID 181]
                  sourceEntityID: "EntityID | UnattachedIdentifier | None" = None,
                  sourceCommunicationsDeviceID: uint16 = 0,
                  sourceLineID: uint8 = 0,
@@ -7365,7 +7635,8 @@ class IntercomControlPdu(RadioCommunicationsFamilyPdu):
         """eid of the entity that has created this intercom channel."""
         self.masterCommunicationsDeviceID = masterCommunicationsDeviceID
         """specific intercom device that has created this intercom channel"""
-        self.intercomParameters = intercomParameters
+        self.intercomParameters = (intercomParameters
+                                   if intercomParameters is not None else [])
         """^^^This is wrong the length of the data field is variable. Using a long for now."""
 
     @property
@@ -7421,7 +7692,7 @@ class SignalPdu(RadioCommunicationsFamilyPdu):
     def __init__(self,
                  entityID: "EntityID | ObjectIdentifier | UnattachedIdentifier | None" = None,
                  radioID: uint16 = 0,
-                 encodingScheme: struct16 = b'00',  # (Table 177), [UID 271], [UID 270]
+                 encodingScheme: struct16 = 0,  # (Table 177), [UID 271], [UID 270]
                  tdlType: enum16 = 0,  # [UID 178]
                  sampleRate: uint32 = 0,
                  samples: uint16 = 0,
@@ -7618,7 +7889,7 @@ class StopFreezeReliablePdu(SimulationManagementWithReliabilityFamilyPdu):
     def __init__(self,
                  realWorldTime: "ClockTime | None" = None,
                  reason: enum8 = 0,  # [UID 67]
-                 frozenBehavior: struct8 = b'0',  # [UID 68]
+                 frozenBehavior: struct8 = 0,  # [UID 68]
                  requiredReliabilityService: enum8 = 0,  # [UID 74]
                  requestID: uint32 = 0):
         super(StopFreezeReliablePdu, self).__init__()
@@ -0,0 +1,131 @@
+#!python
+
+import io
+import unittest
+
+from opendis.appearance import (
+    AppearanceRecord,
+    AirPlatformAppearance,
+    LandPlatformAppearance,
+    MunitionAppearance,
+    RadioAppearance,
+    SpacePlatformAppearance,
+    UnknownAppearance,
+    getEntityAppearanceClass,
+    makeAppearanceClass,
+    serializeAppearances,
+)
+from opendis.DataInputStream import DataInputStream
+from opendis.DataOutputStream import DataOutputStream
+
+
+def allRecordClasses():
+    """Every appearance record class defined in the module."""
+    return [cls for cls in vars(__import__('opendis.appearance',
+                                           fromlist=['appearance'])).values()
+            if isinstance(cls, type)
+            and issubclass(cls, AppearanceRecord)
+            and cls is not AppearanceRecord]
+
+
+class TestAppearance(unittest.TestCase):
+
+    def roundTrip(self, record):
+        memoryStream = io.BytesIO()
+        record.serialize(DataOutputStream(memoryStream))
+        data = memoryStream.getvalue()
+        self.assertEqual(4, len(data))
+        parsed = type(record)()
+        parsed.parse(DataInputStream(data))
+        return data, parsed
+
+    def test_every_class_round_trips_all_ones(self):
+        # Setting every field to its all-ones value exercises each
+        # field's exact shift and width; a wrong entry in a _FIELDS
+        # table would clobber a neighbour and fail the comparison.
+        for cls in allRecordClasses():
+            record = cls(**{name: mask for name, _shift, mask in cls._LAYOUT})
+            data, parsed = self.roundTrip(record)
+            for name, _shift, mask in cls._LAYOUT:
+                self.assertEqual(mask, getattr(parsed, name),
+                                 "%s.%s" % (cls.__name__, name))
+
+    def test_known_word_land_platform(self):
+        # damage=2 (bits 3-4), flaming (bit 15), camouflageType=3
+        # (bits 17-18): word 0x00068010.
+        record = LandPlatformAppearance(damage=2, flaming=1, camouflageType=3)
+        data, parsed = self.roundTrip(record)
+        self.assertEqual(bytes.fromhex("00068010"), data)
+        self.assertEqual(2, parsed.damage)
+        self.assertEqual(1, parsed.flaming)
+        self.assertEqual(3, parsed.camouflageType)
+
+    def test_constructor_masks_fields(self):
+        record = LandPlatformAppearance(paintScheme=True, damage=0xFF)
+        self.assertEqual(1, record.paintScheme)
+        self.assertEqual(3, record.damage)
+
+    def test_serialize_masks_out_of_range_assignment(self):
+        record = RadioAppearance()
+        record.isFrozen = 2  # out of range for a 1-bit field
+        data, _parsed = self.roundTrip(record)
+        self.assertEqual(b"\x00\x00\x00\x00", data)
+
+    def test_unknown_appearance_keeps_whole_word(self):
+        record = UnknownAppearance(appearance=0xDEADBEEF)
+        data, parsed = self.roundTrip(record)
+        self.assertEqual(bytes.fromhex("DEADBEEF"), data)
+        self.assertEqual(0xDEADBEEF, parsed.appearance)
+
+    def test_word_accessors(self):
+        record = MunitionAppearance(damage=3, smokeEmanating=1)
+        word = record.toUint32()
+        restored = MunitionAppearance.fromUint32(word)
+        self.assertEqual(3, restored.damage)
+        self.assertEqual(1, restored.smokeEmanating)
+
+    def test_buffer_paths_match_stream_paths(self):
+        record = AirPlatformAppearance(damage=1, afterburnerOn=1)
+        data, _parsed = self.roundTrip(record)
+        buffer = bytearray(8)
+        self.assertEqual(8, record.serializeInto(buffer, 4))
+        self.assertEqual(data, bytes(buffer[4:]))
+        restored = AirPlatformAppearance.fromBuffer(bytes(buffer), 4)
+        self.assertEqual(1, restored.damage)
+        self.assertEqual(1, restored.afterburnerOn)
+
+    def test_serialize_appearances(self):
+        records = [LandPlatformAppearance(damage=2),
+                   MunitionAppearance(flaming=1)]
+        expected = b"".join(self.roundTrip(record)[0] for record in records)
+        self.assertEqual(expected, serializeAppearances(records))
+
+    def test_slots(self):
+        record = LandPlatformAppearance()
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.noSuchField = 1
+
+    def test_make_appearance_class(self):
+        cls = makeAppearanceClass('TestRecord', [('low', 0, 4), ('high', 4, 4)])
+        data, parsed = self.roundTrip(cls(low=5, high=9))
+        self.assertEqual(bytes.fromhex("00000095"), data)
+        self.assertEqual(5, parsed.low)
+        self.assertEqual(9, parsed.high)
+
+    def test_overlapping_fields_rejected(self):
+        with self.assertRaises(ValueError):
+            makeAppearanceClass('BadRecord', [('a', 0, 2), ('b', 1, 1)])
+
+    def test_get_entity_appearance_class(self):
+        self.assertIs(LandPlatformAppearance, getEntityAppearanceClass(1, 1))
+        self.assertIs(AirPlatformAppearance, getEntityAppearanceClass(1, 2))
+        self.assertIs(SpacePlatformAppearance, getEntityAppearanceClass(1, 5))
+        self.assertIs(MunitionAppearance, getEntityAppearanceClass(2, 0))
+        self.assertIs(RadioAppearance, getEntityAppearanceClass(7, 0))
+        self.assertIs(UnknownAppearance, getEntityAppearanceClass(0, 0))
+        self.assertIs(UnknownAppearance, getEntityAppearanceClass(1, 99))
+
+
+if __name__ == '__main__':
+    unittest.main()
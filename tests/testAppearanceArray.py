@@ -0,0 +1,77 @@
+#!python
+
+import unittest
+
+from opendis.appearance import (
+    LandPlatformAppearance,
+    MunitionAppearance,
+    serializeAppearances,
+)
+
+try:
+    import numpy
+    from opendis.appearancearray import AppearanceArray, decodeBuffer
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class TestAppearanceArray(unittest.TestCase):
+
+    def makeRecords(self):
+        return [LandPlatformAppearance(damage=2, flaming=1),
+                LandPlatformAppearance(paintScheme=1, camouflageType=3),
+                LandPlatformAppearance()]
+
+    def test_wire_form_matches_scalar_classes(self):
+        records = self.makeRecords()
+        array = AppearanceArray.fromRecords(LandPlatformAppearance, records)
+        self.assertEqual(serializeAppearances(records), array.toBytes())
+
+    def test_from_bytes_round_trip(self):
+        records = self.makeRecords()
+        data = serializeAppearances(records)
+        array = AppearanceArray.fromBytes(LandPlatformAppearance, data)
+        self.assertEqual(len(records), len(array))
+        self.assertEqual(data, array.toBytes())
+        restored = array.toRecords()
+        for original, copy in zip(records, restored):
+            self.assertEqual(original.toUint32(), copy.toUint32())
+
+    def test_decode_fields(self):
+        array = AppearanceArray.fromRecords(
+            LandPlatformAppearance, self.makeRecords())
+        fields = array.decodeFields()
+        self.assertEqual([2, 0, 0], list(fields['damage']))
+        self.assertEqual([1, 0, 0], list(fields['flaming']))
+        self.assertEqual([0, 3, 0], list(fields['camouflageType']))
+
+    def test_encode_fields(self):
+        array = AppearanceArray(LandPlatformAppearance, 3)
+        array.encodeFields({'damage': [2, 0, 0],
+                            'flaming': [1, 0, 0],
+                            'paintScheme': [0, 1, 0],
+                            'camouflageType': [0, 3, 0]})
+        expected = AppearanceArray.fromRecords(
+            LandPlatformAppearance, self.makeRecords())
+        self.assertEqual(expected.toBytes(), array.toBytes())
+
+    def test_get_and_set_field(self):
+        array = AppearanceArray(MunitionAppearance, 4)
+        array.setField('damage', [0, 1, 2, 3])
+        self.assertEqual([0, 1, 2, 3], list(array.getField('damage')))
+        # Neighbouring fields stay untouched by a masked overwrite.
+        array.setField('flaming', [1, 1, 1, 1])
+        array.setField('damage', [3, 2, 1, 0])
+        self.assertEqual([3, 2, 1, 0], list(array.getField('damage')))
+        self.assertEqual([1, 1, 1, 1], list(array.getField('flaming')))
+
+    def test_decode_buffer(self):
+        records = self.makeRecords()
+        fields = decodeBuffer(LandPlatformAppearance,
+                              serializeAppearances(records))
+        self.assertEqual([2, 0, 0], list(fields['damage']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#!python
+
+"""Regression tests for serialize-time attribute bugs.
+
+Each of these PDUs used to crash (or mis-serialize) only when
+serialized, so a round trip through the factory is the whole test.
+"""
+
+import unittest
+
+from opendis.dis7 import (
+    DirectedEnergyFirePdu,
+    FirePdu,
+    LinearObjectStatePdu,
+)
+from opendis.DataInputStream import DataInputStream
+from opendis.PduFactory import createPdu, serializePdu
+
+
+class TestSerializeRegressions(unittest.TestCase):
+
+    def test_fire_pdu_status_byte(self):
+        # Pdu.pduStatus stored a PduStatus object but was written with
+        # write_unsigned_byte, so serializing any Pdu subclass raised.
+        pdu = FirePdu()
+        pdu.pduType = 2
+        pdu.pduStatus = 5
+        data = serializePdu(pdu)
+        self.assertEqual(96, len(data))
+        parsed = createPdu(data)
+        self.assertIsInstance(parsed, FirePdu)
+        self.assertEqual(5, parsed.pduStatus)
+
+    def test_linear_object_state_pdu_constructs_and_serializes(self):
+        # __init__ referenced an undefined numberOfSegments name.
+        pdu = LinearObjectStatePdu()
+        self.assertEqual(0, pdu.numberOfSegments)
+        data = serializePdu(pdu)
+        self.assertEqual(40, len(data))
+
+    def test_directed_energy_fire_pdu_cumulative_shot_time(self):
+        # serialize/parse read a misspelled commulativeShotTime.
+        pdu = DirectedEnergyFirePdu(cumulativeShotTime=2.5)
+        data = serializePdu(pdu)
+        parsed = DirectedEnergyFirePdu()
+        parsed.parse(DataInputStream(data))
+        self.assertEqual(2.5, parsed.cumulativeShotTime)
+
+
+if __name__ == '__main__':
+    unittest.main()